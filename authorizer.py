@@ -5,16 +5,62 @@ This module provides JWT token validation for protected API endpoints.
 It validates Supabase JWT tokens and verifies user existence in the database.
 """
 
+import time
 from typing import Any, Dict, Optional
 
 from services.dynamodb import dynamodb
-from services.supabase_auth import supabase_auth
+from services.supabase_auth import (TokenVerificationError, hash_token,
+                                    supabase_auth)
+from utils.cache import TTLCache
 from utils.logging import log_error, setup_logger
 
 # Initialize shared resources at module level for optimal Lambda performance
 # This avoids re-initialization on warm starts and reduces cold start time
 logger = setup_logger(__name__)
 
+# Authorization decisions keyed by token hash, reused across warm invocations
+# when API Gateway's own authorizer cache misses
+TOKEN_CACHE_TTL_SECONDS = 300
+_token_cache = TTLCache(maxsize=1024, ttl=TOKEN_CACHE_TTL_SECONDS)
+
+# Invalid tokens are remembered briefly so repeated garbage tokens are denied
+# without re-running signature verification; tokens that could not be verified
+# (e.g. the Supabase API was unavailable) are not remembered
+INVALID_TOKEN_TTL_SECONDS = 30
+_INVALID_TOKEN = object()
+
+
+# User records keyed by Supabase ID; misses are cached briefly so unknown IDs
+# cannot be used to hammer DynamoDB, while new sign-ups become visible quickly
+USER_CACHE_TTL_SECONDS = 120
+USER_MISS_TTL_SECONDS = 10
+_USER_MISS = object()
+_user_cache = TTLCache(maxsize=2048, ttl=USER_CACHE_TTL_SECONDS)
+
+
+def _get_user(supabase_id: str) -> Optional[Dict[str, Any]]:
+    """Look up a user by Supabase ID, consulting the in-process cache first."""
+    user = _user_cache.get(supabase_id)
+    if user is _USER_MISS:
+        return None
+    if user is not None:
+        return user
+
+    user = dynamodb.get_user_by_supabase_id(supabase_id)
+    if user:
+        _user_cache.set(supabase_id, user)
+    else:
+        _user_cache.set(supabase_id, _USER_MISS, ttl=USER_MISS_TTL_SECONDS)
+    return user
+
+
+def _token_cache_ttl(user_info: Dict[str, Any]) -> float:
+    """Bound the cache lifetime of an authorization by the token's expiry."""
+    exp = user_info.get("exp")
+    if exp is None:
+        return TOKEN_CACHE_TTL_SECONDS
+    return min(exp - time.time(), TOKEN_CACHE_TTL_SECONDS)
+
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -31,26 +77,35 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     Returns:
         Authorization response for API Gateway
     """
-    logger.info(
-        "Authorization request received",
-        extra={
-            "request_id": getattr(context, "aws_request_id", "unknown"),
-            "method": event.get("requestContext", {}).get("http", {}).get("method"),
-            "path": event.get("rawPath"),
-        },
-    )
-
     try:
-        # Extract and validate Supabase user from request token
-        user_info = supabase_auth.get_user_from_request(event)
-        if not user_info or not user_info.get("supabase_id"):
+        token = supabase_auth.get_token_from_request(event)
+        if not token:
+            logger.warning("Authorization failed: No bearer token in request.")
+            return {"isAuthorized": False}
+
+        # Reuse a previous decision for the same token on warm invocations
+        cache_key = hash_token(token)
+        cached_response = _token_cache.get(cache_key)
+        if cached_response is _INVALID_TOKEN:
+            return {"isAuthorized": False}
+        if cached_response is not None:
+            return cached_response
+
+        # Validate Supabase user from request token
+        try:
+            user_info = supabase_auth.validate_jwt_token(token)
+        except TokenVerificationError:
+            logger.warning("Authorization failed: Token could not be verified.")
+            return {"isAuthorized": False}
+        if not user_info:
             logger.warning(
                 "Authorization failed: No valid Supabase user found in token."
             )
+            _token_cache.set(cache_key, _INVALID_TOKEN, ttl=INVALID_TOKEN_TTL_SECONDS)
             return {"isAuthorized": False}
 
         # Get user from DynamoDB by Supabase ID to ensure they are synced
-        user = dynamodb.get_user_by_supabase_id(user_info["supabase_id"])
+        user = _get_user(user_info["supabase_id"])
         if not user:
             logger.warning(
                 "User not found in DynamoDB, denying access.",
@@ -66,16 +121,17 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             )
             return {"isAuthorized": False}
 
-        logger.info(
+        logger.debug(
             "User authorized successfully",
             extra={
+                "request_id": getattr(context, "aws_request_id", "unknown"),
                 "username": username,
                 "supabase_id": user_info["supabase_id"],
             },
         )
 
         # Return authorization success with enriched context
-        return {
+        response = {
             "isAuthorized": True,
             "context": {
                 "principalId": username,
@@ -84,6 +140,8 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 "email": user.get("email"),
             },
         }
+        _token_cache.set(cache_key, response, ttl=_token_cache_ttl(user_info))
+        return response
 
     except Exception as e:
         log_error(
@@ -3,8 +3,17 @@ Handlers package for Lambda function handlers.
 
 This package contains all the API endpoint handlers for authentication,
 user management, and debt management operations.
+
+Submodules are imported lazily: each Lambda function only loads the handler
+module it is configured with, keeping cold starts free of unrelated imports.
 """
 
-from . import auth, debts, users
+import importlib
 
 __all__ = ["auth", "users", "debts"]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
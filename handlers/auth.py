@@ -5,19 +5,24 @@ This module provides Supabase authentication integration,
 handling user synchronization between Supabase Auth and DynamoDB.
 """
 
-import json
 import logging
+from datetime import datetime, timezone
 from typing import Any, Dict
 
+import orjson
+
 from models.users import UserBase
 from services.dynamodb import dynamodb
 from services.supabase_auth import supabase_auth
 from utils.decorators import lambda_handler
-from utils.responses import cors_headers, success_response
+from utils.responses import cors_headers, json_dumps, success_response
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Characters in the email local part that are mapped to "_" in usernames
+_USERNAME_TRANS = str.maketrans(".-", "__")
+
 
 @lambda_handler()
 def sync_user_handler(event: dict, context: dict) -> dict:
@@ -26,7 +31,10 @@ def sync_user_handler(event: dict, context: dict) -> dict:
     This is called when a user first authenticates or when user data needs to be synced
     """
     try:
-        logger.info(f"Sync user request: {json.dumps(event, default=str)}")
+        # The lambda_handler decorator already logs the invocation; avoid
+        # serializing the whole API Gateway event unless debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sync user request", extra={"event_keys": list(event)})
 
         # Validate user from Supabase token
         user_info = supabase_auth.get_user_from_request(event)
@@ -34,7 +42,7 @@ def sync_user_handler(event: dict, context: dict) -> dict:
             return {
                 "statusCode": 401,
                 "headers": cors_headers,
-                "body": json.dumps({"error": "Unauthorized"}),
+                "body": json_dumps({"error": "Unauthorized"}),
             }
 
         # FIRST: Check if user already exists by Supabase ID
@@ -45,7 +53,7 @@ def sync_user_handler(event: dict, context: dict) -> dict:
                 return {
                     "statusCode": 200,
                     "headers": cors_headers,
-                    "body": json.dumps(
+                    "body": json_dumps(
                         {
                             "username": existing_user["username"],
                             "email": existing_user["email"],
@@ -60,26 +68,25 @@ def sync_user_handler(event: dict, context: dict) -> dict:
             logger.info(f"User not found by Supabase ID, creating new: {str(e)}")
 
         # Parse request body for user data
-        body = json.loads(event.get("body", "{}"))
+        body = orjson.loads(event.get("body") or "{}")
 
         # ONLY NOW: Generate username from email if not provided (since we know user doesn't exist)
         username = body.get("username")
         if not username:
-            username = (
-                user_info["email"].split("@")[0].replace(".", "_").replace("-", "_")
-            )
+            username = user_info["email"].split("@", 1)[0].translate(_USERNAME_TRANS)
             # Ensure username is unique by checking DynamoDB once.
             # If it exists, append a part of the unique Supabase ID.
             try:
-                existing_user = dynamodb.get_user_by_username(username)
-                if existing_user:
+                if dynamodb.username_exists(username):
                     unique_suffix = user_info["supabase_id"].split("-")[0]
                     username = f"{username}_{unique_suffix}"
             except Exception:
                 pass  # Username is likely available
 
-        # Create new user
-        user_data = UserBase(
+        # Create new user, stamping both timestamps from a single clock read.
+        # Token-derived fields are trusted; username/full_name are validated.
+        now = datetime.now(timezone.utc)
+        user_data = UserBase.from_verified_identity(
             username=username,
             email=user_info["email"],
             full_name=body.get(
@@ -88,6 +95,8 @@ def sync_user_handler(event: dict, context: dict) -> dict:
             supabase_id=user_info["supabase_id"],
             avatar_url=user_info.get("user_metadata", {}).get("avatar_url"),
             is_email_verified=user_info.get("email_verified", True),
+            created_at=now,
+            updated_at=now,
         )
 
         # Save to DynamoDB
@@ -101,23 +110,21 @@ def sync_user_handler(event: dict, context: dict) -> dict:
             "full_name": user_data.full_name,
             "supabase_id": user_data.supabase_id,
             "avatar_url": user_data.avatar_url,
-            "created_at": (
-                user_data.created_at.isoformat() if user_data.created_at else None
-            ),
+            "created_at": now.isoformat(),
         }
 
         return success_response(data=response_data, status_code=201)
 
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         return {
             "statusCode": 400,
             "headers": cors_headers,
-            "body": json.dumps({"error": "Invalid JSON in request body"}),
+            "body": json_dumps({"error": "Invalid JSON in request body"}),
         }
     except Exception as e:
         logger.error(f"Error syncing user: {str(e)}")
         return {
             "statusCode": 500,
             "headers": cors_headers,
-            "body": json.dumps({"error": "Internal server error"}),
+            "body": json_dumps({"error": "Internal server error"}),
         }
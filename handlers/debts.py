@@ -8,13 +8,14 @@ This module provides CRUD operations for debt management following REST best pra
 - User authorization through JWT context
 """
 
+import base64
+import binascii
 import logging
 from datetime import datetime, timezone
+from decimal import Decimal
 
-from pydantic import ValidationError
-
-from models.debt import DebtBase, DebtCreate, debt_item_to_dict
-from services.dynamodb import DebtManagementTable
+from models.debt import DebtBase, DebtCreate, DebtUpdate
+from services.dynamodb import dynamodb
 from utils.decorators import (extract_path_params, lambda_handler,
                               require_auth, validate_json_body)
 from utils.responses import (HTTPStatus, error_response, not_found_response,
@@ -23,7 +24,26 @@ from utils.responses import (HTTPStatus, error_response, not_found_response,
 # Initialize shared resources at module level for optimal Lambda performance
 # This avoids re-initialization on warm starts and reduces cold start time
 logger = logging.getLogger(__name__)
-table = DebtManagementTable()
+
+# Fields a client may set when creating a debt
+_CREATE_FIELDS = tuple(DebtCreate.model_fields)
+
+# Largest page size accepted by list_debts
+MAX_PAGE_SIZE = 100
+
+
+def _encode_cursor(debt_id: str) -> str:
+    """Encode the last debt ID of a page as an opaque pagination cursor."""
+    return base64.urlsafe_b64encode(debt_id.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> str:
+    """Decode a pagination cursor back into the debt ID to resume after."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return base64.b64decode(padded, altchars=b"-_", validate=True).decode()
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError("invalid cursor") from e
 
 
 @lambda_handler()
@@ -48,35 +68,27 @@ def create_debt(event, context):
     body = event["json_body"]
     auth_username = event["auth"]["username"]
 
-    try:
-        # Validate the input using DebtCreate model
-        debt_create = DebtCreate(**body)
-
-        # Add username from auth context and create full debt model
-        debt_data = debt_create.model_dump()
-        debt_data["username"] = auth_username
-
-        # Create and validate debt model (debt_id will be auto-generated)
-        debt = DebtBase(**debt_data)
-
-        # Add timestamps
-        now = datetime.now(timezone.utc)
-        debt.created_at = now
-        debt.updated_at = now
+    # Accept only the client-settable fields defined by DebtCreate, then add
+    # the username from auth context and timestamps, and validate the full
+    # debt model in a single pass (debt_id will be auto-generated); validation
+    # errors are turned into a 400 response by the lambda_handler decorator
+    now = datetime.now(timezone.utc)
+    debt_data = {field: body[field] for field in _CREATE_FIELDS if field in body}
+    debt_data["username"] = auth_username
+    debt_data["created_at"] = now
+    debt_data["updated_at"] = now
+    debt = DebtBase.model_validate(debt_data)
 
+    try:
         # Use shared table instance for optimal performance
-        table.put_debt(debt)
+        dynamodb.put_debt(debt)
 
         return success_response(
-            data=debt_item_to_dict(debt.to_dynamodb_item()),
+            data=debt.to_response_dict(),
             message=f"Debt '{debt.debt_name}' created successfully",
             status_code=HTTPStatus.CREATED,
         )
 
-    except ValidationError as e:
-        return validation_error_response(
-            "Debt validation failed", {"validation_errors": e.errors()}
-        )
     except Exception as e:
         # Log the actual exception for debugging
         logger.error(f"Error creating debt: {str(e)}", exc_info=True)
@@ -117,57 +129,91 @@ def get_debt(event, context):
     auth_username = event["auth"]["username"]
 
     # Use shared table instance for optimal performance
-    debt = table.get_debt(auth_username, debt_id)
+    debt = dynamodb.get_debt(auth_username, debt_id)
 
+    # Debts are keyed by the owner's username, so a hit is always owned by
+    # the authenticated user
     if not debt:
         return not_found_response("Debt", debt_id)
 
-    # Verify ownership (additional security check)
-    if debt.username != auth_username:
-        return error_response(
-            "Access denied: You can only access your own debts",
-            HTTPStatus.FORBIDDEN,
-        )
-
-    return success_response(data=debt_item_to_dict(debt.to_dynamodb_item()))
+    return success_response(data=debt.to_response_dict())
 
 
 @lambda_handler()
 @require_auth
 def list_debts(event, context):
     """
-    List all debts for the authenticated user.
+    List debts for the authenticated user.
 
-    GET /debts
+    GET /debts?limit={limit}&cursor={cursor}
 
-    Retrieves all debts for the authenticated user. Supports optional query parameters
-    for filtering and pagination (can be added later).
+    Retrieves the authenticated user's debts. Without a limit all debts are
+    returned; with a limit one page is returned along with a ``next_cursor`` to
+    pass as ``cursor`` for the following page. The summary always covers all
+    of the user's debts.
 
     Args:
-        event: Lambda event object
+        event: Lambda event object with optional limit and cursor query parameters
         context: Lambda context object
 
     Returns:
         HTTP response with list of debts
     """
     auth_username = event["auth"]["username"]
+    query_params = event.get("queryStringParameters") or {}
+
+    try:
+        limit = int(query_params["limit"]) if "limit" in query_params else None
+        if limit is not None and not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+
+        start_key = None
+        if query_params.get("cursor"):
+            start_key = {
+                "PK": f"USER#{auth_username}",
+                "SK": f"DEBT#{_decode_cursor(query_params['cursor'])}",
+            }
+    except ValueError as e:
+        return validation_error_response(
+            "Invalid pagination parameters", {"pagination_error": str(e)}
+        )
 
     try:
         # Use shared table instance for optimal performance
-        debts = table.list_user_debts(auth_username)
+        debts, last_key = dynamodb.list_user_debts(
+            auth_username, limit=limit, exclusive_start_key=start_key
+        )
 
-        # Calculate summary statistics
-        total_principal = sum(debt.principal for debt in debts)
-        total_balance = sum(debt.current_balance or 0 for debt in debts)
+        # Serialize debts and calculate summary statistics in a single pass
+        total_principal = Decimal(0)
+        total_balance = Decimal(0)
+        debt_dicts = []
+        for debt in debts:
+            total_principal += debt.principal
+            total_balance += debt.current_balance or 0
+            debt_dicts.append(debt.to_response_dict())
+        total_debts = len(debts)
+
+        # A single page doesn't cover every debt, so total them separately
+        # with a query that projects only the summed attributes
+        if limit is not None:
+            total_debts, total_principal, total_balance = dynamodb.sum_user_debts(
+                auth_username
+            )
 
         return success_response(
             data={
-                "debts": [debt_item_to_dict(debt.to_dynamodb_item()) for debt in debts],
+                "debts": debt_dicts,
                 "summary": {
-                    "total_debts": len(debts),
+                    "total_debts": total_debts,
                     "total_principal": float(total_principal),
                     "total_current_balance": float(total_balance),
                 },
+                "next_cursor": (
+                    _encode_cursor(last_key["SK"].removeprefix("DEBT#"))
+                    if last_key
+                    else None
+                ),
             }
         )
     except Exception as e:
@@ -205,48 +251,25 @@ def update_debt(event, context):
     debt_id = event["path_params"]["debt_id"]
     auth_username = event["auth"]["username"]
 
-    # Get existing debt using shared table instance
-    existing_debt = table.get_debt(auth_username, debt_id)
-    if not existing_debt:
-        return not_found_response("Debt", debt_id)
-
-    # Verify ownership
-    if existing_debt.username != auth_username:
-        return error_response(
-            "Access denied: You can only update your own debts",
-            HTTPStatus.FORBIDDEN,
-        )
+    # Validate only the fields provided in the request; null values are
+    # ignored, and debt_id, username and created_at cannot be changed
+    fields = DebtUpdate.model_validate(body).to_dynamodb_attributes()
+    fields["updated_at"] = datetime.now(timezone.utc).isoformat()
 
     try:
-        # Create a copy of existing debt data
-        updated_data = existing_debt.model_dump()
-
-        # Update only the fields provided in the request
-        for field, value in body.items():
-            if value is not None:  # Only update non-null values
-                updated_data[field] = value
+        # Apply the changes with a single conditional UpdateItem; the key is
+        # scoped to the authenticated user, so only the owner's debts are found
+        updated_item = dynamodb.update_debt_fields(auth_username, debt_id, fields)
+        if not updated_item:
+            return not_found_response("Debt", debt_id)
 
-        # Ensure required fields are preserved
-        updated_data["username"] = auth_username
-        updated_data["debt_id"] = debt_id
-        updated_data["created_at"] = existing_debt.created_at
-        updated_data["updated_at"] = datetime.now(timezone.utc)
-
-        # Create updated debt model
-        updated_debt = DebtBase(**updated_data)
-
-        # Store updated debt using shared table instance
-        table.update_debt(updated_debt)
+        updated_debt = DebtBase.from_dynamodb_item(updated_item)
 
         return success_response(
-            data=debt_item_to_dict(updated_debt.to_dynamodb_item()),
+            data=updated_debt.to_response_dict(),
             message=f"Debt '{updated_debt.debt_name}' updated successfully",
         )
 
-    except ValidationError as e:
-        return validation_error_response(
-            "Debt validation failed", {"validation_errors": e.errors()}
-        )
     except Exception:
         return error_response("Failed to update debt", HTTPStatus.INTERNAL_SERVER_ERROR)
 
@@ -272,28 +295,21 @@ def delete_debt(event, context):
     debt_id = event["path_params"]["debt_id"]
     auth_username = event["auth"]["username"]
 
-    # Check if debt exists and verify ownership using shared table instance
-    existing_debt = table.get_debt(auth_username, debt_id)
-    if not existing_debt:
-        return not_found_response("Debt", debt_id)
-
-    if existing_debt.username != auth_username:
-        return error_response(
-            "Access denied: You can only delete your own debts",
-            HTTPStatus.FORBIDDEN,
-        )
-
     try:
-        # Delete debt using shared table instance
-        table.delete_debt(auth_username, debt_id)
+        # A single conditional delete both checks existence and returns the
+        # deleted debt; the key is scoped to the authenticated user, so only
+        # the owner's debts can be deleted
+        deleted_debt = dynamodb.delete_debt(auth_username, debt_id)
+        if not deleted_debt:
+            return not_found_response("Debt", debt_id)
 
         return success_response(
             data={
                 "debt_id": debt_id,
-                "debt_name": existing_debt.debt_name,
+                "debt_name": deleted_debt.debt_name,
                 "username": auth_username,
             },
-            message=f"Debt '{existing_debt.debt_name}' deleted successfully",
+            message=f"Debt '{deleted_debt.debt_name}' deleted successfully",
         )
 
     except Exception:
@@ -1,12 +1,12 @@
 import json
 import os
-import subprocess
-import sys
 from datetime import datetime
+from functools import lru_cache
 
 import pulumi
 import pulumi_aws as aws
 from components.lambda_function import DockerLambdaFunction
+from get_image_tag import get_content_hash as compute_content_hash
 
 # Get current AWS account ID and region
 current = aws.get_caller_identity()
@@ -19,34 +19,30 @@ ecr_repository = aws.ecr.Repository(
 
 
 def get_content_hash():
-    """Get content-based hash using the standalone script."""
+    """Get content-based hash by calling the image tag script in-process."""
     try:
-        result = subprocess.run(
-            [sys.executable, "get_image_tag.py"],
-            capture_output=True,
-            text=True,
-            cwd=os.path.dirname(__file__),
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
-        else:
-            # Fallback to timestamp if script fails
-            return datetime.now().strftime("%Y%m%d-%H%M%S")
+        return compute_content_hash()
     except Exception:
-        # Fallback to timestamp if script fails
+        # Fallback to timestamp if hashing fails
         return datetime.now().strftime("%Y%m%d-%H%M%S")
 
 
-# Use content-based image tag to force updates when code changes
-# Read the tag from a file if it exists (set by Makefile), otherwise generate it
-tag_file = "image_tag.txt"
-if os.path.exists(tag_file):
-    with open(tag_file, "r") as f:
-        image_tag = f.read().strip()
-else:
-    image_tag = get_content_hash()
+@lru_cache(maxsize=None)
+def get_image_tag():
+    """Get the image tag, computing it at most once per run."""
+    # Read the tag from a file if it exists (set by Makefile), otherwise generate it
+    tag_file = "image_tag.txt"
+    if os.path.exists(tag_file):
+        with open(tag_file, "r") as f:
+            return f.read().strip()
+    return get_content_hash()
 
-image_uri = ecr_repository.repository_url.apply(lambda url: f"{url}:{image_tag}")
+
+# Use content-based image tag to force updates when code changes. The tag is
+# resolved lazily, only once the repository URL is known, so previews that
+# can't materialize the image URI skip hashing the source tree.
+image_tag = ecr_repository.repository_url.apply(lambda _: get_image_tag())
+image_uri = ecr_repository.repository_url.apply(lambda url: f"{url}:{get_image_tag()}")
 
 # DynamoDB Table
 dynamodb_table = aws.dynamodb.Table(
@@ -58,6 +54,7 @@ dynamodb_table = aws.dynamodb.Table(
         {"name": "SK", "type": "S"},
         {"name": "GSI1PK", "type": "S"},
         {"name": "GSI1SK", "type": "S"},
+        {"name": "GSI2PK", "type": "S"},
     ],
     hash_key="PK",
     range_key="SK",
@@ -74,6 +71,12 @@ dynamodb_table = aws.dynamodb.Table(
             "range_key": "GSI1SK",
             "projection_type": "ALL",
         },
+        {
+            # Sparse index of users by email (EMAIL#{email})
+            "name": "GSI2",
+            "hash_key": "GSI2PK",
+            "projection_type": "ALL",
+        },
     ],
 )
 
@@ -130,10 +133,13 @@ lambda_functions = {
     "get-debt": {
         "handler": "handlers.debts.get_debt",
         "protected": True,
+        "provisioned_concurrency": 2,  # Hot read path, keep warm
     },
     "list-debts": {
         "handler": "handlers.debts.list_debts",
         "protected": True,
+        "memory_size": 1024,  # Serializes the user's full debt list
+        "provisioned_concurrency": 2,  # Hot read path, keep warm
     },
     "update-debt": {
         "handler": "handlers.debts.update_debt",
@@ -169,6 +175,8 @@ for name, config in lambda_functions.items():
         shared_image_uri=image_uri,
         environment_vars=lambda_env_vars,
         additional_policies=policies,
+        memory_size=config.get("memory_size", 512),
+        provisioned_concurrency=config.get("provisioned_concurrency"),
     )
 
 # Create the authorizer function
@@ -180,6 +188,7 @@ authorizer_function = DockerLambdaFunction(
     additional_policies=[
         dynamodb_policy
     ],  # Only needs DynamoDB to check user existence
+    provisioned_concurrency=2,  # Runs in front of every protected route
 )
 
 # API Gateway HTTP API
@@ -211,6 +220,7 @@ authorizer_permission = aws.lambda_.Permission(
     "authorizer-permission",
     action="lambda:InvokeFunction",
     function=authorizer_function.name,
+    qualifier=authorizer_function.qualifier,
     principal="apigateway.amazonaws.com",
     source_arn=pulumi.Output.concat(api.execution_arn, "/authorizers/", authorizer.id),
 )
@@ -276,6 +286,9 @@ routes = [
     },
 ]
 
+# Execute-API ARN prefix shared by all route permissions
+route_source_arn_prefix = pulumi.Output.concat(api.execution_arn, "/", stage.name, "/")
+
 # Create integrations, permissions, and routes
 for route_config in routes:
     function_name = route_config["function"]
@@ -287,12 +300,10 @@ for route_config in routes:
         f"{resource_name}-permission",
         action="lambda:InvokeFunction",
         function=functions[function_name].name,
+        qualifier=functions[function_name].qualifier,
         principal="apigateway.amazonaws.com",
         source_arn=pulumi.Output.concat(
-            api.execution_arn,
-            "/",
-            stage.name,
-            "/",
+            route_source_arn_prefix,
             route_config["method"],
             "/*",  # Use wildcard to handle path parameters
         ),
@@ -13,6 +13,7 @@ class DockerLambdaFunction(pulumi.ComponentResource):
     - IAM Role with basic execution permissions
     - Custom IAM policies
     - Environment variables
+    - Optional provisioned concurrency on a published "live" alias
     """
 
     def __init__(
@@ -23,7 +24,9 @@ class DockerLambdaFunction(pulumi.ComponentResource):
         environment_vars: Optional[Dict[str, pulumi.Input[str]]] = None,
         additional_policies: Optional[List[pulumi.Input[str]]] = None,
         timeout: int = 30,
-        memory_size: int = 128,
+        memory_size: int = 512,  # Lambda CPU scales with memory
+        provisioned_concurrency: Optional[int] = None,
+        architecture: str = "arm64",  # Must match the image platform
         opts: Optional[pulumi.ResourceOptions] = None,
     ):
         super().__init__("custom:aws:DockerLambdaFunction", name, None, opts)
@@ -78,12 +81,15 @@ class DockerLambdaFunction(pulumi.ComponentResource):
         self.function = aws.lambda_.Function(
             f"{name}-function",
             package_type="Image",
+            architectures=[architecture],
             image_uri=shared_image_uri,
             role=self.role.arn,
             timeout=timeout,
             memory_size=memory_size,
             environment={"variables": environment_vars or {}},
             image_config={"commands": [handler]},
+            # Provisioned concurrency requires a published version
+            publish=bool(provisioned_concurrency),
             opts=pulumi.ResourceOptions(parent=self, depends_on=[self.log_group]),
         )
 
@@ -91,6 +97,29 @@ class DockerLambdaFunction(pulumi.ComponentResource):
         self.arn = self.function.arn
         self.name = self.function.name
         self.invoke_arn = self.function.invoke_arn
+        self.qualifier = None
+
+        # Keep pre-initialized environments warm behind an alias; callers must
+        # invoke the alias (invoke_arn/qualifier) for this to take effect
+        if provisioned_concurrency:
+            self.alias = aws.lambda_.Alias(
+                f"{name}-alias",
+                name="live",
+                function_name=self.function.name,
+                function_version=self.function.version,
+                opts=pulumi.ResourceOptions(parent=self),
+            )
+            self.provisioned_concurrency_config = (
+                aws.lambda_.ProvisionedConcurrencyConfig(
+                    f"{name}-provisioned-concurrency",
+                    function_name=self.function.name,
+                    qualifier=self.alias.name,
+                    provisioned_concurrent_executions=provisioned_concurrency,
+                    opts=pulumi.ResourceOptions(parent=self),
+                )
+            )
+            self.invoke_arn = self.alias.invoke_arn
+            self.qualifier = self.alias.name
 
         self.register_outputs(
             {
@@ -5,46 +5,154 @@ This ensures consistent tagging between Pulumi infrastructure and Makefile build
 """
 
 import hashlib
+import json
 import os
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
+# Resolve paths against the project root so the result doesn't depend on the
+# caller's working directory (the script is also imported by Pulumi)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-def get_content_hash():
-    """Generate a hash based on the content of the source code."""
-    hash_md5 = hashlib.md5()
+# Per-file digests keyed by path, mtime and size, so unchanged files aren't
+# re-read on subsequent runs
+DIGEST_CACHE_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), ".image_tag_cache.json"
+)
+
+
+def _scandir_py(root):
+    """Recursively yield the paths of Python files under root."""
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                # DirEntry type checks reuse data from the directory listing,
+                # avoiding a stat() call per file
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scandir_py(entry.path)
+                elif entry.name.endswith(".py") and entry.is_file(
+                    follow_symlinks=False
+                ):
+                    yield entry.path
+    except (FileNotFoundError, PermissionError):
+        # Missing or unreadable directories contribute nothing to the hash
+        pass
+
+
+def _load_digest_cache():
+    """Load cached file digests, ignoring a missing or corrupt cache file."""
+    try:
+        with open(DIGEST_CACHE_FILE, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_digest_cache(cache):
+    """Persist file digests for the next run; failing to write is harmless."""
+    try:
+        with open(DIGEST_CACHE_FILE, "w") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+
+def _digest_file(fingerprint, cache):
+    """
+    Digest a file, reusing the cached digest if its mtime and size are unchanged.
+
+    Takes a (path, mtime_ns, size) fingerprint and returns the cache key (None
+    if the file can't be read) and the digest.
+    """
+    file_path, mtime_ns, size = fingerprint
+    key = f"{file_path}:{mtime_ns}:{size}"
+    if key in cache:
+        return key, bytes.fromhex(cache[key])
+
+    try:
+        # Digest in C without reading the file into a Python bytes object
+        with open(file_path, "rb") as f:
+            return key, hashlib.file_digest(f, "blake2b").digest()
+    except OSError:
+        # If file can't be read, skip it
+        return None, b""
+
+
+def _discover_files():
+    """
+    Return the sorted paths of the source files that affect the Docker image.
+
+    This must match the Docker build context, which .dockerignore limits to
+    exactly these files.
+    """
+    project_root = PROJECT_ROOT
 
     # Include key files that affect the Docker image
     files_to_hash = [
-        "../Dockerfile",
-        "../pyproject.toml",
-        "../uv.lock",
-        "../main.py",
-        "../authorizer.py",
+        os.path.join(project_root, name)
+        for name in [
+            "Dockerfile",
+            ".dockerignore",
+            "pyproject.toml",
+            "uv.lock",
+            "main.py",
+            "authorizer.py",
+        ]
     ]
 
     # Add all Python files in handlers, models, services, utils
-    for root in ["../handlers", "../models", "../services", "../utils"]:
-        if os.path.exists(root):
-            for subdir, dirs, files in os.walk(root):
-                for file in files:
-                    if file.endswith(".py"):
-                        files_to_hash.append(os.path.join(subdir, file))
-
-    # Hash the content of all files
-    for file_path in files_to_hash:
+    for name in ["handlers", "models", "services", "utils"]:
+        files_to_hash.extend(_scandir_py(os.path.join(project_root, name)))
+
+    # Sort so the per-file digests are combined in a deterministic order
+    return tuple(sorted(files_to_hash))
+
+
+def _fingerprint(paths):
+    """Return (path, mtime_ns, size) for each path, skipping missing files."""
+    fingerprint = []
+    for path in paths:
         try:
-            if os.path.exists(file_path):
-                with open(file_path, "rb") as f:
-                    hash_md5.update(f.read())
-        except Exception:
-            # If file doesn't exist or can't be read, skip it
-            pass
-
-    # Add current timestamp to ensure uniqueness even with same content
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    hash_md5.update(timestamp.encode())
-
-    return f"{timestamp}-{hash_md5.hexdigest()[:8]}"
+            stat = os.stat(path)
+        except OSError:
+            continue
+        fingerprint.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(fingerprint)
+
+
+@lru_cache(maxsize=None)
+def _hash_from_fingerprint(fingerprint):
+    """Hash the files in a fingerprint; memoized for repeat calls in a process."""
+    content_hash = hashlib.blake2b(digest_size=16)
+
+    # Hash the content of all files in parallel, then combine each file's
+    # project-relative path and digest in path order so the result is
+    # deterministic and renaming or moving a file changes the tag
+    cache = _load_digest_cache()
+    new_cache = {}
+    with ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) * 2)) as pool:
+        for (path, _, _), (key, digest) in zip(
+            fingerprint, pool.map(lambda entry: _digest_file(entry, cache), fingerprint)
+        ):
+            content_hash.update(os.path.relpath(path, PROJECT_ROOT).encode() + b"\0")
+            content_hash.update(digest)
+            if key:
+                new_cache[key] = digest.hex()
+
+    # Only keep entries for current files so the cache doesn't grow unbounded
+    if new_cache != cache:
+        _save_digest_cache(new_cache)
+
+    # The tag depends only on content, so unchanged sources map to the same
+    # tag and an image that was already built and pushed can be reused
+    return content_hash.hexdigest()[:12]
+
+
+def get_content_hash():
+    """Generate a hash based on the content of the source code."""
+    # Files are only re-hashed when one is added, removed or modified, so
+    # later calls in the same process just stat the files
+    return _hash_from_fingerprint(_fingerprint(_discover_files()))
 
 
 if __name__ == "__main__":
@@ -3,10 +3,23 @@ Models package for data structures and database entities.
 
 This package contains Pydantic models for data validation and
 DynamoDB item representations.
+
+Models are imported lazily so that loading one module (for example
+``models.debt``) does not also build the schemas of unrelated models.
 """
 
-from .debt import DebtBase
-from .dynamodb import DynamoDBItem
-from .users import UserBase
+import importlib
+
+_EXPORTS = {
+    "UserBase": ".users",
+    "DebtBase": ".debt",
+    "DynamoDBItem": ".dynamodb",
+}
 
 __all__ = ["UserBase", "DebtBase", "DynamoDBItem"]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,66 +3,129 @@
 import uuid
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any, Dict, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
-from models.dynamodb import DebtItem
+from models.dynamodb import parse_iso_datetime
+
+# Accepted payment frequencies
+PaymentFrequency = Literal["weekly", "biweekly", "monthly", "quarterly", "annually"]
+
+# Monetary amounts and rates; DynamoDB numbers hold at most 38 significant
+# digits, so anything wider or absurdly large is rejected up front instead of
+# failing the write
+Amount = Annotated[Decimal, Field(max_digits=38, lt=Decimal("1e15"))]
+
+
+def _new_debt_id() -> str:
+    """Generate a new debt ID as a UUID4 in compact 32-character hex form."""
+    return uuid.uuid4().hex
+
+
+def _stored_decimal(value: Any) -> Optional[Decimal]:
+    """Read a stored amount, which older items hold as a string."""
+    # A stored 0 is a real amount; only absent values (and the empty strings
+    # older items used for them) mean "not set"
+    if value is None or value == "":
+        return None
+    return value if isinstance(value, Decimal) else Decimal(value)
 
 
 class DebtBase(BaseModel):
     """Base model for debt items."""
 
     debt_id: str = Field(
-        default_factory=lambda: str(uuid.uuid4()),
+        default_factory=_new_debt_id,
         description="Unique identifier for the debt",
     )
     username: str = Field(..., min_length=3, max_length=50)
     debt_name: str = Field(
         ..., min_length=1, max_length=100, description="User-friendly name for the debt"
     )
-    principal: Decimal = Field(..., gt=0)
-    interest_rate: Decimal = Field(..., ge=0)
+    principal: Amount = Field(..., gt=0)
+    interest_rate: Amount = Field(..., ge=0)
     start_date: datetime
     end_date: Optional[datetime] = None
     description: Optional[str] = None
     creditor: Optional[str] = None
-    payment_frequency: str = Field(
-        ..., pattern="^(weekly|biweekly|monthly|quarterly|annually)$"
-    )
-    payment_amount: Optional[Decimal] = Field(None, gt=0)
-    minimum_payment: Optional[Decimal] = Field(None, gt=0)
-    current_balance: Optional[Decimal] = Field(None, ge=0)
+    payment_frequency: PaymentFrequency
+    payment_amount: Optional[Amount] = Field(None, gt=0)
+    minimum_payment: Optional[Amount] = Field(None, gt=0)
+    current_balance: Optional[Amount] = Field(None, ge=0)
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    def to_dynamodb_item(self) -> DebtItem:
-        """Convert to DynamoDB item format."""
-        now = datetime.now(timezone.utc).isoformat()
+    @staticmethod
+    def pk_for(username: str) -> str:
+        """Return the partition key holding a user's debts."""
+        return f"USER#{username}"
+
+    def to_dynamodb_item(self) -> Dict[str, Any]:
+        """
+        Convert to a DynamoDB item.
+
+        Returns a plain dict ready for boto3; attributes without a value are
+        left out rather than stored as NULL (a NULL GSI key is rejected).
+        """
+        pk = self.pk_for(self.username)
+        sk = f"DEBT#{self.debt_id}"
+        now = None
+        if self.created_at is None or self.updated_at is None:
+            now = datetime.now(timezone.utc).isoformat()
         created = self.created_at.isoformat() if self.created_at else now
         updated = self.updated_at.isoformat() if self.updated_at else now
 
-        return DebtItem(
-            PK=f"USER#{self.username}",
-            SK=f"DEBT#{self.debt_id}",
-            debt_id=self.debt_id,
-            debt_name=self.debt_name,
-            principal=str(self.principal),
-            interest_rate=str(self.interest_rate),
-            start_date=self.start_date.isoformat(),
-            end_date=self.end_date.isoformat() if self.end_date else None,
-            description=self.description,
-            creditor=self.creditor,
-            payment_frequency=self.payment_frequency,
-            payment_amount=str(self.payment_amount) if self.payment_amount else None,
-            minimum_payment=str(self.minimum_payment) if self.minimum_payment else None,
-            current_balance=str(self.current_balance) if self.current_balance else None,
-            created_at=created,
-            updated_at=updated,
+        item = {
+            "PK": pk,
+            "SK": sk,
+            "debt_id": self.debt_id,
+            "debt_name": self.debt_name,
+            "principal": self.principal,
+            "interest_rate": self.interest_rate,
+            "start_date": self.start_date.isoformat(),
+            "end_date": self.end_date.isoformat() if self.end_date else None,
+            "description": self.description,
+            "creditor": self.creditor,
+            "payment_frequency": self.payment_frequency,
+            "payment_amount": self.payment_amount,
+            "minimum_payment": self.minimum_payment,
+            "current_balance": self.current_balance,
+            "created_at": created,
+            "updated_at": updated,
             # Populate GSI fields for potential future use (e.g., querying debts by creditor)
-            GSI1PK=f"CREDITOR#{self.creditor}" if self.creditor else None,
-            GSI1SK=f"USER#{self.username}#DEBT#{self.debt_id}",
-        )
+            "GSI1PK": f"CREDITOR#{self.creditor}" if self.creditor else None,
+            "GSI1SK": f"{pk}#{sk}",
+        }
+        return {key: value for key, value in item.items() if value is not None}
+
+    def to_response_dict(self) -> Dict[str, Any]:
+        """Convert to a dictionary for API responses."""
+
+        def _float(value: Optional[Decimal]) -> Optional[float]:
+            return float(value) if value is not None else None
+
+        now = None
+        if self.created_at is None or self.updated_at is None:
+            now = datetime.now(timezone.utc).isoformat()
+
+        return {
+            "debt_id": self.debt_id,
+            "username": self.username,
+            "debt_name": self.debt_name,
+            "principal": float(self.principal),
+            "interest_rate": float(self.interest_rate),
+            "start_date": self.start_date.isoformat(),
+            "end_date": self.end_date.isoformat() if self.end_date else None,
+            "description": self.description,
+            "creditor": self.creditor,
+            "payment_frequency": self.payment_frequency,
+            "payment_amount": _float(self.payment_amount),
+            "minimum_payment": _float(self.minimum_payment),
+            "current_balance": _float(self.current_balance),
+            "created_at": self.created_at.isoformat() if self.created_at else now,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else now,
+        }
 
     @classmethod
     def from_dynamodb_item(cls, item: Dict[str, Any]) -> "DebtBase":
@@ -71,60 +134,39 @@ class DebtBase(BaseModel):
             return None
 
         # Extract the username from PK format "USER#{username}"
-        username = item.get("PK", "").replace("USER#", "") if "PK" in item else ""
+        username = item.get("PK", "").removeprefix("USER#")
         # Extract debt_id from SK format "DEBT#{debt_id}"
         debt_id = (
-            item.get("SK", "").replace("DEBT#", "")
+            item["SK"].removeprefix("DEBT#")
             if "SK" in item
             else item.get("debt_id", "")
         )
 
-        return cls(
+        # Items were validated when written, so skip re-validating them
+        return cls.model_construct(
             debt_id=debt_id,
             username=username,
             debt_name=item.get("debt_name", ""),
-            principal=Decimal(item.get("principal", "0")),
-            interest_rate=Decimal(item.get("interest_rate", "0")),
-            start_date=(
-                datetime.fromisoformat(item.get("start_date"))
-                if "start_date" in item
-                else datetime.now()
-            ),
-            end_date=(
-                datetime.fromisoformat(item.get("end_date"))
-                if item.get("end_date")
-                else None
-            ),
+            principal=_stored_decimal(item.get("principal")) or Decimal(0),
+            interest_rate=_stored_decimal(item.get("interest_rate")) or Decimal(0),
+            start_date=parse_iso_datetime(item.get("start_date")) or datetime.now(),
+            end_date=parse_iso_datetime(item.get("end_date")),
             description=item.get("description"),
             creditor=item.get("creditor"),
             payment_frequency=item.get("payment_frequency", "monthly"),
-            payment_amount=(
-                Decimal(item.get("payment_amount"))
-                if item.get("payment_amount")
-                else None
-            ),
-            minimum_payment=(
-                Decimal(item.get("minimum_payment"))
-                if item.get("minimum_payment")
-                else None
-            ),
-            current_balance=(
-                Decimal(item.get("current_balance"))
-                if item.get("current_balance")
-                else None
-            ),
-            created_at=(
-                datetime.fromisoformat(item.get("created_at"))
-                if "created_at" in item
-                else None
-            ),
-            updated_at=(
-                datetime.fromisoformat(item.get("updated_at"))
-                if "updated_at" in item
-                else None
-            ),
+            payment_amount=_stored_decimal(item.get("payment_amount")),
+            minimum_payment=_stored_decimal(item.get("minimum_payment")),
+            current_balance=_stored_decimal(item.get("current_balance")),
+            created_at=parse_iso_datetime(item.get("created_at")),
+            updated_at=parse_iso_datetime(item.get("updated_at")),
         )
 
+    @classmethod
+    def from_dynamodb_items(cls, items: List[Dict[str, Any]]) -> List["DebtBase"]:
+        """Create DebtBase instances from the items of a query response."""
+        from_item = cls.from_dynamodb_item
+        return [from_item(item) for item in items]
+
 
 class DebtCreate(BaseModel):
     """Model for creating new debts - excludes auto-generated fields."""
@@ -132,47 +174,49 @@ class DebtCreate(BaseModel):
     debt_name: str = Field(
         ..., min_length=1, max_length=100, description="User-friendly name for the debt"
     )
-    principal: Decimal = Field(..., gt=0)
-    interest_rate: Decimal = Field(..., ge=0)
+    principal: Amount = Field(..., gt=0)
+    interest_rate: Amount = Field(..., ge=0)
     start_date: datetime
     end_date: Optional[datetime] = None
     description: Optional[str] = None
     creditor: Optional[str] = None
-    payment_frequency: str = Field(
-        ..., pattern="^(weekly|biweekly|monthly|quarterly|annually)$"
-    )
-    payment_amount: Optional[Decimal] = Field(None, gt=0)
-    minimum_payment: Optional[Decimal] = Field(None, gt=0)
-    current_balance: Optional[Decimal] = Field(None, ge=0)
+    payment_frequency: PaymentFrequency
+    payment_amount: Optional[Amount] = Field(None, gt=0)
+    minimum_payment: Optional[Amount] = Field(None, gt=0)
+    current_balance: Optional[Amount] = Field(None, ge=0)
 
 
-def debt_item_to_dict(debt_item: DebtItem) -> Dict[str, Any]:
-    """Convert a DebtItem to a dictionary for API responses."""
-    # Extract username from PK format "USER#{username}"
-    username = (
-        debt_item.PK.replace("USER#", "") if debt_item.PK.startswith("USER#") else ""
-    )
+class DebtUpdate(BaseModel):
+    """Model for partial debt updates - every field is optional."""
 
-    return {
-        "debt_id": debt_item.debt_id,
-        "username": username,
-        "debt_name": debt_item.debt_name,
-        "principal": float(debt_item.principal),
-        "interest_rate": float(debt_item.interest_rate),
-        "start_date": debt_item.start_date,
-        "end_date": debt_item.end_date,
-        "description": debt_item.description,
-        "creditor": debt_item.creditor,
-        "payment_frequency": debt_item.payment_frequency,
-        "payment_amount": (
-            float(debt_item.payment_amount) if debt_item.payment_amount else None
-        ),
-        "minimum_payment": (
-            float(debt_item.minimum_payment) if debt_item.minimum_payment else None
-        ),
-        "current_balance": (
-            float(debt_item.current_balance) if debt_item.current_balance else None
-        ),
-        "created_at": debt_item.created_at,
-        "updated_at": debt_item.updated_at,
-    }
+    debt_name: Optional[str] = Field(
+        None,
+        min_length=1,
+        max_length=100,
+        description="User-friendly name for the debt",
+    )
+    principal: Optional[Amount] = Field(None, gt=0)
+    interest_rate: Optional[Amount] = Field(None, ge=0)
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    description: Optional[str] = None
+    creditor: Optional[str] = None
+    payment_frequency: Optional[PaymentFrequency] = None
+    payment_amount: Optional[Amount] = Field(None, gt=0)
+    minimum_payment: Optional[Amount] = Field(None, gt=0)
+    current_balance: Optional[Amount] = Field(None, ge=0)
+
+    def to_dynamodb_attributes(self) -> Dict[str, Any]:
+        """Convert the provided (non-null) fields to DynamoDB attribute values."""
+        attributes = {}
+        for field, value in self.model_dump(exclude_none=True).items():
+            if isinstance(value, datetime):
+                attributes[field] = value.isoformat()
+            else:
+                attributes[field] = value
+
+        # Keep the creditor GSI key in step with the creditor
+        if "creditor" in attributes:
+            attributes["GSI1PK"] = f"CREDITOR#{attributes['creditor']}"
+
+        return attributes
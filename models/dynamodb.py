@@ -1,13 +1,31 @@
 """DynamoDB data models for the debt management system."""
 
+from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+
+@lru_cache(maxsize=1024)
+def _fromisoformat(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+def parse_iso_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse a stored ISO 8601 timestamp, returning None when it is missing."""
+    if not value:
+        return None
+    return _fromisoformat(value)
 
 
 class DynamoDBItem(BaseModel):
     """Base class for all DynamoDB items."""
 
+    # Items are read-only snapshots of stored data; attributes the model
+    # doesn't declare are dropped rather than kept on the instance
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     PK: str
     SK: str
 
@@ -26,28 +44,4 @@ class UserItem(DynamoDBItem):
     updated_at: str
     GSI1PK: str | None = None  # supabase_id
     GSI1SK: str | None = None  # supabase_id
-
-
-class DebtItem(DynamoDBItem):
-    """Represents a debt item in DynamoDB."""
-
-    PK: str  # USER#{username}
-    SK: str  # DEBT#{debt_id}
-    debt_id: str  # Unique identifier for the debt
-    debt_name: str  # User-friendly name for the debt
-    principal: str  # Stored as string to preserve precision
-    interest_rate: str  # Stored as string to preserve precision
-    start_date: str
-    end_date: str | None = None
-    description: str | None = None
-    creditor: str | None = None
-    payment_frequency: str
-    payment_amount: str | None = None
-    minimum_payment: str | None = None
-    current_balance: str | None = None  # Stored as string to preserve precision
-    created_at: str
-    updated_at: str
-    GSI1PK: str | None = None  # For optional GSI1 (e.g., CREDITOR#{creditor})
-    GSI1SK: str | None = (
-        None  # For optional GSI1 (e.g., USER#{username}#DEBT#{debt_id})
-    )
+    GSI2PK: str | None = None  # EMAIL#{email}
@@ -1,58 +1,80 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict
 
-import pydantic
 from pydantic import BaseModel, EmailStr, Field, SecretStr
 
-from models.dynamodb import UserItem
+from models.dynamodb import parse_iso_datetime
 
 
 class UserBase(BaseModel):
     """Base model for user data."""
 
-    username: str = Field(..., min_length=3, max_length=50)
+    # Usernames must not contain spaces
+    username: str = Field(..., min_length=3, max_length=50, pattern=r"^[^ ]+$")
     email: EmailStr
     full_name: str = Field(..., min_length=3, max_length=100)
-    supabase_id: str | None = None  # Supabase auth user ID
+    # Supabase auth user ID, required for all authenticated users
+    supabase_id: str = Field(..., min_length=1)
     avatar_url: str | None = None  # Profile picture URL from OAuth provider
     is_email_verified: bool = True  # Supabase users have verified emails
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
-    @pydantic.field_validator("username")
-    def username_must_not_contain_spaces(cls, v):
-        if " " in v:
-            raise ValueError("Username must not contain spaces")
-        return v
+    @classmethod
+    def from_verified_identity(
+        cls,
+        username: str,
+        full_name: str,
+        supabase_id: str,
+        email: str,
+        **identity: Any,
+    ) -> "UserBase":
+        """
+        Create a UserBase from a verified Supabase identity.
 
-    @pydantic.model_validator(mode="after")
-    def validate_auth_method(self):
-        """Ensure user has Supabase ID (required for all authenticated users)."""
-        if not self.supabase_id:
-            raise ValueError("User must have Supabase ID")
-        return self
+        Identity fields come from a signature-checked Supabase token and are
+        assigned without re-validation; the user-supplied ``username`` and
+        ``full_name`` go through field validation, as do ``supabase_id`` and
+        ``email``, which every user must have (phone or anonymous sign-ins
+        carry no email).
+        """
+        user = cls.model_construct(**identity)
+        validator = cls.__pydantic_validator__
+        validator.validate_assignment(user, "username", username)
+        validator.validate_assignment(user, "full_name", full_name)
+        validator.validate_assignment(user, "supabase_id", supabase_id)
+        validator.validate_assignment(user, "email", email)
+        return user
 
-    def to_dynamodb_item(self) -> UserItem:
-        """Convert to DynamoDB item format."""
-        from datetime import timezone
+    def to_dynamodb_item(self) -> Dict[str, Any]:
+        """
+        Convert to a DynamoDB item, shaped like UserItem.
 
-        now = datetime.now(timezone.utc).isoformat()
+        Returns a plain dict ready for boto3; attributes without a value are
+        left out rather than stored as NULL.
+        """
+        now = None
+        if self.created_at is None or self.updated_at is None:
+            now = datetime.now(timezone.utc).isoformat()
         created = self.created_at.isoformat() if self.created_at else now
         updated = self.updated_at.isoformat() if self.updated_at else now
 
-        return UserItem(
-            PK=f"USER#{self.username}",
-            SK="USER#INFO",
-            email=self.email,
-            full_name=self.full_name,
-            supabase_id=self.supabase_id,
-            avatar_url=self.avatar_url,
-            is_email_verified=self.is_email_verified,
-            created_at=created,
-            updated_at=updated,
-            GSI1PK=self.supabase_id,
-            GSI1SK=self.supabase_id,
-        )
+        item = {
+            "PK": f"USER#{self.username}",
+            "SK": "USER#INFO",
+            "email": self.email,
+            "full_name": self.full_name,
+            "supabase_id": self.supabase_id,
+            "avatar_url": self.avatar_url,
+            "is_email_verified": self.is_email_verified,
+            "created_at": created,
+            "updated_at": updated,
+            "GSI1PK": self.supabase_id,
+            "GSI1SK": self.supabase_id,
+            # Only users with an email are indexed, keeping GSI2 sparse
+            "GSI2PK": f"EMAIL#{self.email}" if self.email else None,
+        }
+        return {key: value for key, value in item.items() if value is not None}
 
     @classmethod
     def from_dynamodb_item(cls, item: Dict[str, Any]) -> "UserBase":
@@ -61,23 +83,16 @@ class UserBase(BaseModel):
             return None
 
         # Extract the username from PK format "USER#{username}"
-        username = item.get("PK", "").replace("USER#", "") if "PK" in item else ""
+        username = item.get("PK", "").removeprefix("USER#")
 
-        return cls(
+        # Items were validated when written, so skip re-validating them
+        return cls.model_construct(
             username=username,
             email=item.get("email", ""),
             full_name=item.get("full_name", ""),
             supabase_id=item.get("supabase_id"),
             avatar_url=item.get("avatar_url"),
             is_email_verified=item.get("is_email_verified", True),
-            created_at=(
-                datetime.fromisoformat(item.get("created_at"))
-                if "created_at" in item
-                else None
-            ),
-            updated_at=(
-                datetime.fromisoformat(item.get("updated_at"))
-                if "updated_at" in item
-                else None
-            ),
+            created_at=parse_iso_datetime(item.get("created_at")),
+            updated_at=parse_iso_datetime(item.get("updated_at")),
         )
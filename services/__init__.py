@@ -3,12 +3,28 @@ Services package for business logic and external integrations.
 
 This package contains service classes for database operations,
 external API integrations, and business logic.
+
+Services are imported lazily: importing ``services.dynamodb`` does not also
+load the Supabase auth client (and PyJWT), which debt handlers never use.
+
+Only names that don't collide with a submodule are re-exported: once
+``services.supabase_auth`` has been imported, the package attribute of that
+name is the submodule, so the client instance is imported from it directly
+with ``from services.supabase_auth import supabase_auth``.
 """
 
-from .dynamodb import DebtManagementTable
-from .supabase_auth import supabase_auth
+import importlib
+
+_EXPORTS = {
+    "DebtManagementTable": ".dynamodb",
+}
 
 __all__ = [
     "DebtManagementTable",
-    "supabase_auth",
 ]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,13 +7,22 @@ and resource reuse for optimal Lambda performance.
 
 import logging
 import os
-from typing import List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import boto3
 import botocore
+from botocore.config import Config
 
 from models.debt import DebtBase
-from models.users import UserBase
+from utils.cache import TTLCache
+
+if TYPE_CHECKING:
+    # Loaded on first use: the user model pulls in email validation, which
+    # debt-only Lambdas never need
+    from models.users import UserBase
 
 # Initialize shared resources at module level for optimal Lambda performance
 # This avoids re-initialization on warm starts and reduces cold start time
@@ -21,8 +30,80 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 # Create a single DynamoDB resource instance to be reused across all operations
-# This provides connection pooling and reduces cold start overhead
-_dynamodb_resource = boto3.resource("dynamodb")
+# This provides connection pooling and reduces cold start overhead. Keep-alive
+# holds connections open across warm invocations, tight timeouts fail fast
+# instead of burning Lambda duration on hung sockets, and adaptive retries
+# back off on throttling.
+_DYNAMODB_CONFIG = Config(
+    connect_timeout=1,
+    read_timeout=3,
+    tcp_keepalive=True,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
+_dynamodb_resource = boto3.resource("dynamodb", config=_DYNAMODB_CONFIG)
+
+# Background worker used to prefetch the next page of multi-page queries.
+# boto3 resources are not thread-safe, so the worker queries through its own
+# session and resource, created on first use, rather than the shared one.
+_page_executor = ThreadPoolExecutor(max_workers=1)
+_worker_local = threading.local()
+
+
+def _query_page(table_name: str, query_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Runs one Query on the page worker thread.
+
+    :param table_name: Name of the table to query.
+    :param query_kwargs: Arguments for the Query call.
+    :return: The Query response.
+    """
+    resource = getattr(_worker_local, "resource", None)
+    if resource is None:
+        resource = boto3.session.Session().resource("dynamodb", config=_DYNAMODB_CONFIG)
+        _worker_local.resource = resource
+    return resource.Table(table_name).query(**query_kwargs)
+
+
+# User items are cached briefly by username: warm containers often read the
+# same user on consecutive requests, and writes through put_user invalidate
+USER_CACHE_TTL_SECONDS = 30
+
+
+def _update_expression(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Builds UpdateItem arguments that set the given attributes.
+
+    Attributes mapped to None are removed from the item instead. Every name
+    is aliased so reserved words can be updated.
+
+    :param fields: Attribute names mapped to their new DynamoDB values.
+    :return: UpdateExpression and its attribute names and values.
+    """
+    set_clauses = []
+    remove_clauses = []
+    names = {}
+    values = {}
+    for i, (field, value) in enumerate(fields.items()):
+        names[f"#f{i}"] = field
+        if value is None:
+            remove_clauses.append(f"#f{i}")
+        else:
+            values[f":v{i}"] = value
+            set_clauses.append(f"#f{i} = :v{i}")
+
+    expression = []
+    if set_clauses:
+        expression.append("SET " + ", ".join(set_clauses))
+    if remove_clauses:
+        expression.append("REMOVE " + ", ".join(remove_clauses))
+
+    kwargs = {
+        "UpdateExpression": " ".join(expression),
+        "ExpressionAttributeNames": names,
+    }
+    if values:
+        kwargs["ExpressionAttributeValues"] = values
+    return kwargs
 
 
 class DebtManagementTable:
@@ -44,8 +125,26 @@ class DebtManagementTable:
 
         # Use the shared DynamoDB resource for optimal performance
         self.table = _dynamodb_resource.Table(table_name)
+        self._user_cache = TTLCache(maxsize=1024, ttl=USER_CACHE_TTL_SECONDS)
 
-    def put_user(self, user: UserBase) -> bool:
+    def warm_connection(self) -> None:
+        """
+        Opens the HTTPS connection to DynamoDB ahead of the first real request.
+
+        Issues a key-only read of a key that never exists. The read runs on
+        the calling thread, since the shared boto3 resource is not thread-safe;
+        the client's short connect and read timeouts bound how long it can
+        take. Failures are logged and ignored; the connection is then simply
+        opened on first use.
+        """
+        try:
+            self.table.get_item(
+                Key={"PK": "WARMUP", "SK": "WARMUP"}, ProjectionExpression="PK"
+            )
+        except Exception as err:
+            logger.warning("Couldn't warm DynamoDB connection: %s", err)
+
+    def put_user(self, user: "UserBase") -> bool:
         """
         Adds a user to the DynamoDB table.
 
@@ -53,8 +152,9 @@ class DebtManagementTable:
         :return: True if successful, raises exception otherwise.
         """
         try:
-            ddb_item = user.to_dynamodb_item().model_dump()
+            ddb_item = user.to_dynamodb_item()
             self.table.put_item(Item=ddb_item)
+            self._user_cache.pop(user.username)
             return True
         except botocore.exceptions.ClientError as err:
             logger.error(
@@ -66,21 +166,37 @@ class DebtManagementTable:
             )
             raise
 
-    def get_user(self, username: str) -> Optional[UserBase]:
+    def _get_user_item(self, username: str) -> dict | None:
         """
-        Gets user data from the table.
+        Gets a user item by username, consulting the in-process cache first.
 
         :param username: The username of the user to retrieve.
-        :return: The user if found, None otherwise.
+        :return: The user item if found, None otherwise.
         """
-        try:
+        item = self._user_cache.get(username)
+        if item is None:
             response = self.table.get_item(
                 Key={"PK": f"USER#{username}", "SK": "USER#INFO"}
             )
             item = response.get("Item")
+            if item:
+                self._user_cache.set(username, item)
+        return item
+
+    def get_user(self, username: str) -> Optional["UserBase"]:
+        """
+        Gets user data from the table.
+
+        :param username: The username of the user to retrieve.
+        :return: The user if found, None otherwise.
+        """
+        try:
+            item = self._get_user_item(username)
             if not item:
                 return None
 
+            from models.users import UserBase
+
             return UserBase.from_dynamodb_item(item)
         except botocore.exceptions.ClientError as err:
             logger.error(
@@ -117,9 +233,7 @@ class DebtManagementTable:
             user_item = items[0]
 
             # Extract username from PK format "USER#{username}" and add it to the dict
-            pk = user_item.get("PK", "")
-            username = pk.replace("USER#", "") if pk.startswith("USER#") else ""
-            user_item["username"] = username
+            user_item["username"] = user_item.get("PK", "").removeprefix("USER#")
 
             return user_item
 
@@ -141,21 +255,16 @@ class DebtManagementTable:
         :return: The user item as dict if found, None otherwise.
         """
         try:
-            response = self.table.get_item(
-                Key={"PK": f"USER#{username}", "SK": "USER#INFO"}
-            )
-            item = response.get("Item")
+            item = self._get_user_item(username)
             if not item:
                 return None
 
-            # Extract username from PK format "USER#{username}" and add it to the dict
-            pk = item.get("PK", "")
-            extracted_username = (
-                pk.replace("USER#", "") if pk.startswith("USER#") else ""
-            )
-            item["username"] = extracted_username
+            # Extract username from PK format "USER#{username}" and add it to a
+            # copy of the dict, leaving the cached item untouched
+            user = dict(item)
+            user["username"] = item.get("PK", "").removeprefix("USER#")
 
-            return item
+            return user
 
         except botocore.exceptions.ClientError as err:
             logger.error(
@@ -167,7 +276,32 @@ class DebtManagementTable:
             )
             raise
 
-    def create_user(self, user: UserBase) -> bool:
+    def username_exists(self, username: str) -> bool:
+        """
+        Checks whether a username is already taken.
+
+        Only the key attribute is projected, so the read stays minimal.
+
+        :param username: The username to check.
+        :return: True if a user with this username exists, False otherwise.
+        """
+        try:
+            response = self.table.get_item(
+                Key={"PK": f"USER#{username}", "SK": "USER#INFO"},
+                ProjectionExpression="PK",
+            )
+            return "Item" in response
+        except botocore.exceptions.ClientError as err:
+            logger.error(
+                "Couldn't check username %s in table %s. Error: %s: %s",
+                username,
+                self.table.name,
+                err.response["Error"]["Code"],
+                err.response["Error"]["Message"],
+            )
+            raise
+
+    def create_user(self, user: "UserBase") -> bool:
         """
         Creates a new user in the DynamoDB table.
 
@@ -176,25 +310,29 @@ class DebtManagementTable:
         """
         return self.put_user(user)
 
-    def get_user_by_email(self, email: str) -> UserBase | None:
+    def get_user_by_email(self, email: str) -> Optional["UserBase"]:
         """
-        Gets user data by email using scan.
+        Gets user data by email using the GSI2 email index.
 
         :param email: The email address to search for.
         :return: The user if found, None otherwise.
         """
         try:
-            # Use scan since we don't have a GSI for email yet
-            # In production, consider adding a GSI for better performance
-            response = self.table.scan(
-                FilterExpression="email = :email",
-                ExpressionAttributeValues={":email": email},
+            # A single-partition query on the sparse email index instead of a
+            # scan, which would read (and bill) every item in the table
+            response = self.table.query(
+                IndexName="GSI2",
+                KeyConditionExpression="GSI2PK = :gsi2pk",
+                ExpressionAttributeValues={":gsi2pk": f"EMAIL#{email}"},
+                Limit=1,
             )
 
             items = response.get("Items", [])
             if not items:
                 return None
 
+            from models.users import UserBase
+
             # Return the first match (should be unique)
             return UserBase.from_dynamodb_item(items[0])
 
@@ -208,7 +346,7 @@ class DebtManagementTable:
             )
             raise
 
-    def update_user(self, user: UserBase) -> bool:
+    def update_user(self, user: "UserBase") -> bool:
         """
         Updates an existing user in the table.
 
@@ -226,7 +364,7 @@ class DebtManagementTable:
         :return: True if successful, raises exception otherwise.
         """
         try:
-            ddb_item = debt.to_dynamodb_item().model_dump()
+            ddb_item = debt.to_dynamodb_item()
             self.table.put_item(Item=ddb_item)
             return True
         except botocore.exceptions.ClientError as err:
@@ -269,27 +407,99 @@ class DebtManagementTable:
             )
             raise
 
-    def list_user_debts(self, username: str) -> List[DebtBase]:
+    def list_user_debts(
+        self,
+        username: str,
+        limit: Optional[int] = None,
+        exclusive_start_key: Optional[dict] = None,
+    ) -> Tuple[List[DebtBase], Optional[dict]]:
         """
-        Lists all debts for a specific user.
+        Lists debts for a specific user.
+
+        Without a limit every page of the query is read; with a limit a single
+        page is returned together with the key to resume from.
 
         :param username: The username of the debt owner.
-        :return: A list of debts associated with the user.
+        :param limit: Maximum number of debts to return.
+        :param exclusive_start_key: Key returned by a previous page to resume after.
+        :return: The debts and the last evaluated key, or None if there are no more.
         """
+        query_kwargs = {
+            "KeyConditionExpression": "PK = :pk AND begins_with(SK, :sk_prefix)",
+            "ExpressionAttributeValues": {
+                ":pk": f"USER#{username}",
+                ":sk_prefix": "DEBT#",
+            },
+        }
+        if limit is not None:
+            query_kwargs["Limit"] = limit
+        if exclusive_start_key:
+            query_kwargs["ExclusiveStartKey"] = exclusive_start_key
+
         try:
-            response = self.table.query(
-                KeyConditionExpression="PK = :pk AND begins_with(SK, :sk_prefix)",
-                ExpressionAttributeValues={
-                    ":pk": f"USER#{username}",
-                    ":sk_prefix": "DEBT#",
-                },
+            debts = []
+            response = self.table.query(**query_kwargs)
+            while True:
+                # When more pages follow, fetch the next one in the background
+                # while this page's items are parsed
+                last_key = response.get("LastEvaluatedKey")
+                next_page = None
+                if limit is None and last_key:
+                    query_kwargs["ExclusiveStartKey"] = last_key
+                    next_page = _page_executor.submit(
+                        _query_page, self.table.name, dict(query_kwargs)
+                    )
+
+                debts.extend(DebtBase.from_dynamodb_items(response.get("Items", [])))
+                if next_page is None:
+                    return debts, last_key
+                response = next_page.result()
+        except botocore.exceptions.ClientError as err:
+            logger.error(
+                "Couldn't list debts for user %s from table %s. Error: %s: %s",
+                username,
+                self.table.name,
+                err.response["Error"]["Code"],
+                err.response["Error"]["Message"],
             )
+            raise
 
-            items = response.get("Items", [])
-            return [DebtBase.from_dynamodb_item(item) for item in items]
+    def sum_user_debts(self, username: str) -> Tuple[int, Decimal, Decimal]:
+        """
+        Totals all debts for a specific user.
+
+        Only the summed attributes are projected, so far less data is read than
+        when listing the full debts.
+
+        :param username: The username of the debt owner.
+        :return: The number of debts, total principal and total current balance.
+        """
+        query_kwargs = {
+            "KeyConditionExpression": "PK = :pk AND begins_with(SK, :sk_prefix)",
+            "ProjectionExpression": "principal, current_balance",
+            "ExpressionAttributeValues": {
+                ":pk": f"USER#{username}",
+                ":sk_prefix": "DEBT#",
+            },
+        }
+
+        try:
+            count = 0
+            total_principal = Decimal(0)
+            total_balance = Decimal(0)
+            while True:
+                response = self.table.query(**query_kwargs)
+                for item in response.get("Items", []):
+                    count += 1
+                    total_principal += Decimal(item.get("principal") or 0)
+                    total_balance += Decimal(item.get("current_balance") or 0)
+                last_key = response.get("LastEvaluatedKey")
+                if not last_key:
+                    return count, total_principal, total_balance
+                query_kwargs["ExclusiveStartKey"] = last_key
         except botocore.exceptions.ClientError as err:
             logger.error(
-                "Couldn't list debts for user %s from table %s. Error: %s: %s",
+                "Couldn't sum debts for user %s from table %s. Error: %s: %s",
                 username,
                 self.table.name,
                 err.response["Error"]["Code"],
@@ -297,20 +507,27 @@ class DebtManagementTable:
             )
             raise
 
-    def delete_debt(self, username: str, debt_id: str) -> bool:
+    def delete_debt(self, username: str, debt_id: str) -> DebtBase | None:
         """
         Deletes a specific debt item from the table.
 
+        The delete is conditional on the debt existing and returns the deleted
+        item, so callers need no separate read to check for or describe it.
+
         :param username: The username of the debt owner.
         :param debt_id: The unique ID of the debt to delete.
-        :return: True if successful, raises exception otherwise.
+        :return: The deleted debt, or None if it did not exist.
         """
         try:
-            self.table.delete_item(
-                Key={"PK": f"USER#{username}", "SK": f"DEBT#{debt_id}"}
+            response = self.table.delete_item(
+                Key={"PK": f"USER#{username}", "SK": f"DEBT#{debt_id}"},
+                ConditionExpression="attribute_exists(PK)",
+                ReturnValues="ALL_OLD",
             )
-            return True
+            return DebtBase.from_dynamodb_item(response["Attributes"])
         except botocore.exceptions.ClientError as err:
+            if err.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return None
             logger.error(
                 "Couldn't delete debt %s for user %s from table %s. Error: %s: %s",
                 debt_id,
@@ -321,16 +538,76 @@ class DebtManagementTable:
             )
             raise
 
+    def update_debt_fields(
+        self, username: str, debt_id: str, fields: Dict[str, Any]
+    ) -> dict | None:
+        """
+        Updates only the given attributes of an existing debt item.
+
+        A single conditional UpdateItem sets the fields and returns the updated
+        item, so no read is needed before or after the write.
+
+        :param username: The username of the debt owner.
+        :param debt_id: The unique ID of the debt to update.
+        :param fields: Attribute names mapped to their new DynamoDB values;
+            attributes mapped to None are removed.
+        :return: The updated item as dict, or None if the debt does not exist.
+        """
+        try:
+            response = self.table.update_item(
+                Key={"PK": f"USER#{username}", "SK": f"DEBT#{debt_id}"},
+                ConditionExpression="attribute_exists(PK)",
+                ReturnValues="ALL_NEW",
+                **_update_expression(fields),
+            )
+            return response["Attributes"]
+        except botocore.exceptions.ClientError as err:
+            if err.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return None
+            logger.error(
+                "Couldn't update debt %s for user %s in table %s. Error: %s: %s",
+                debt_id,
+                username,
+                self.table.name,
+                err.response["Error"]["Code"],
+                err.response["Error"]["Message"],
+            )
+            raise
+
     def update_debt(self, debt: DebtBase) -> bool:
         """
         Updates an existing debt item in the table.
 
+        The write is conditional on the debt still existing, so an update can
+        never recreate a debt that was deleted in the meantime.
+
         :param debt: The debt with updated information.
-        :return: True if successful, raises exception otherwise.
+        :return: True if successful, False if the debt does not exist.
         """
-        # Simply reuse the put_debt method since DynamoDB's put_item replaces the item if it exists
-        return self.put_debt(debt)
+        try:
+            ddb_item = debt.to_dynamodb_item()
+            self.table.put_item(
+                Item=ddb_item, ConditionExpression="attribute_exists(PK)"
+            )
+            return True
+        except botocore.exceptions.ClientError as err:
+            if err.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return False
+            logger.error(
+                "Couldn't update debt %s for user %s in table %s. Error: %s: %s",
+                debt.debt_id,
+                debt.username,
+                self.table.name,
+                err.response["Error"]["Code"],
+                err.response["Error"]["Message"],
+            )
+            raise
 
 
 # Global instance for easy access
 dynamodb = DebtManagementTable()
+
+# Complete the TCP/TLS handshake during the Lambda init phase, so the first
+# invocation of a cold container doesn't pay for it
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    dynamodb.warm_connection()
@@ -2,15 +2,29 @@
 Supabase authentication service for validating JWT tokens
 """
 
+import hashlib
 import logging
 import os
 from typing import Any, Dict, Optional
 
 import jwt
+import orjson
 from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
 
+from utils.events import get_header
+
 logger = logging.getLogger(__name__)
 
+# Shared decoder with the required claims baked into its default options, so
+# each verification doesn't rebuild and merge the options dict
+_JWT = jwt.PyJWT(options={"require": ["exp", "sub"]})
+_JWT_ALGORITHMS = ["HS256"]
+
+
+class TokenVerificationError(Exception):
+    """Raised when a token could be neither accepted nor rejected, e.g. because
+    the Supabase API timed out or returned a server error"""
+
 
 class SupabaseAuth:
     def __init__(self):
@@ -20,6 +34,14 @@ class SupabaseAuth:
             "SUPABASE_ANON_KEY"
         )  # Add anon key for API calls
 
+        # HMAC keys are bytes; encode the secret once instead of per token
+        self._jwt_secret_bytes = (
+            self.supabase_jwt_secret.encode() if self.supabase_jwt_secret else None
+        )
+
+        # HTTP session for API-based verification, created on first use
+        self._session = None
+
         if not self.supabase_url:
             logger.warning("Supabase URL not configured")
 
@@ -36,14 +58,18 @@ class SupabaseAuth:
             token: The JWT token from the Authorization header
 
         Returns:
-            Dictionary containing user information if valid, None otherwise
+            Dictionary containing user information if valid, None if the token
+            is invalid
+
+        Raises:
+            TokenVerificationError: If the token could not be verified
         """
         # Try manual JWT verification first (if secret is available)
         if self.supabase_jwt_secret:
             return self._validate_jwt_manual(token)
 
         # Fallback to API-based verification
-        logger.info("Using API-based token verification (no JWT secret available)")
+        logger.debug("Using API-based token verification (no JWT secret available)")
         return self._validate_jwt_via_api(token)
 
     def _validate_jwt_manual(self, token: str) -> Optional[Dict[str, Any]]:
@@ -53,11 +79,12 @@ class SupabaseAuth:
                 logger.error("Supabase JWT secret not configured")
                 return None
 
-            # Decode and verify the JWT token
-            payload = jwt.decode(
+            # Decode and verify the JWT token; signature, expiry, audience and
+            # presence of the subject claim are all checked in a single pass
+            payload = _JWT.decode(
                 token,
-                self.supabase_jwt_secret,
-                algorithms=["HS256"],
+                self._jwt_secret_bytes,
+                algorithms=_JWT_ALGORITHMS,
                 audience="authenticated",
             )
 
@@ -74,7 +101,9 @@ class SupabaseAuth:
                 "iss": payload.get("iss"),
             }
 
-            logger.info(f"Successfully validated token for user: {user_info['email']}")
+            logger.debug(
+                "Successfully validated token for user: %s", user_info["email"]
+            )
             return user_info
 
         except ExpiredSignatureError:
@@ -85,7 +114,43 @@ class SupabaseAuth:
             return None
         except Exception as e:
             logger.error(f"Error validating JWT token: {str(e)}")
-            return None
+            raise TokenVerificationError(str(e)) from e
+
+    def _get_session(self):
+        """
+        Get the pooled HTTP session used to call the Supabase API
+
+        The session keeps connections alive across warm invocations, so only
+        the first API verification pays for the TCP and TLS handshake.
+        """
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            session.mount(
+                "https://",
+                HTTPAdapter(
+                    pool_connections=10,
+                    pool_maxsize=50,
+                    max_retries=Retry(
+                        total=2,
+                        backoff_factor=0.1,
+                        status_forcelist=[502, 503, 504],
+                        allowed_methods=["GET"],
+                    ),
+                ),
+            )
+            session.headers.update(
+                {
+                    "apikey": self.supabase_anon_key,
+                    "Content-Type": "application/json",
+                }
+            )
+            self._session = session
+
+        return self._session
 
     def _validate_jwt_via_api(self, token: str) -> Optional[Dict[str, Any]]:
         """
@@ -93,27 +158,25 @@ class SupabaseAuth:
         This method works without needing the JWT secret
         """
         try:
-            import requests
-
             if not self.supabase_url or not self.supabase_anon_key:
                 logger.error(
                     "Supabase URL or anon key not configured for API verification"
                 )
                 return None
 
-            # Call Supabase auth API to verify the token
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "apikey": self.supabase_anon_key,
-                "Content-Type": "application/json",
-            }
-
-            response = requests.get(
-                f"{self.supabase_url}/auth/v1/user", headers=headers, timeout=10
+            # Call Supabase auth API to verify the token; the apikey and
+            # content type headers are set once on the shared session
+            response = self._get_session().get(
+                f"{self.supabase_url}/auth/v1/user",
+                headers={"Authorization": f"Bearer {token}"},
+                timeout=10,
             )
 
             if response.status_code == 200:
-                user_data = response.json()
+                user_data = orjson.loads(response.content)
+                if not user_data.get("id"):
+                    logger.warning("Token validation via API returned no user ID")
+                    return None
 
                 # Convert to our expected format
                 user_info = {
@@ -123,15 +186,23 @@ class SupabaseAuth:
                     "provider": user_data.get("app_metadata", {}).get("provider"),
                     "user_metadata": user_data.get("user_metadata", {}),
                     "aud": user_data.get("aud"),
-                    "exp": None,  # Not provided by API
-                    "iat": None,  # Not provided by API
                     "iss": "supabase",
                 }
-
-                logger.info(
-                    f"Successfully validated token via API for user: {user_info['email']}"
+                # The API doesn't return the token's lifetime; the token was
+                # just accepted by Supabase, so read it from the claims as-is
+                claims = _JWT.decode(token, options={"verify_signature": False})
+                user_info["exp"] = claims.get("exp")
+                user_info["iat"] = claims.get("iat")
+
+                logger.debug(
+                    "Successfully validated token via API for user: %s",
+                    user_info["email"],
                 )
                 return user_info
+            elif response.status_code >= 500:
+                raise TokenVerificationError(
+                    f"Supabase API returned {response.status_code}"
+                )
             else:
                 logger.warning(
                     f"Token validation failed via API: {response.status_code}"
@@ -139,8 +210,12 @@ class SupabaseAuth:
                 return None
 
         except Exception as e:
+            # Timeouts, connection and server errors say nothing about the
+            # token itself, so they are not reported as an invalid token
             logger.error(f"Error validating JWT token via API: {str(e)}")
-            return None
+            if isinstance(e, TokenVerificationError):
+                raise
+            raise TokenVerificationError(str(e)) from e
 
     def extract_token_from_header(self, authorization_header: str) -> Optional[str]:
         """
@@ -152,14 +227,43 @@ class SupabaseAuth:
         Returns:
             The JWT token if valid format, None otherwise
         """
-        if not authorization_header:
+        # Check the scheme prefix and slice out the token rather than
+        # splitting the whole header into a list
+        if (
+            not authorization_header
+            or len(authorization_header) < 8
+            or authorization_header[:7].lower() != "bearer "
+        ):
             return None
 
-        parts = authorization_header.split()
-        if len(parts) != 2 or parts[0].lower() != "bearer":
+        token = authorization_header[7:].strip()
+        if not token or " " in token or "\t" in token:
             return None
 
-        return parts[1]
+        return token
+
+    def get_token_from_request(self, event: Dict[str, Any]) -> Optional[str]:
+        """
+        Extract the bearer token from a Lambda event
+
+        Args:
+            event: AWS Lambda event containing headers
+
+        Returns:
+            The JWT token if present and well-formed, None otherwise
+        """
+        authorization = get_header(event, "authorization")
+
+        if not authorization:
+            logger.debug("No Authorization header found")
+            return None
+
+        token = self.extract_token_from_header(authorization)
+        if not token:
+            logger.debug("Invalid Authorization header format")
+            return None
+
+        return token
 
     def get_user_from_request(self, event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -172,16 +276,8 @@ class SupabaseAuth:
             User information if authentication successful, None otherwise
         """
         try:
-            headers = event.get("headers", {})
-            authorization = headers.get("Authorization") or headers.get("authorization")
-
-            if not authorization:
-                logger.debug("No Authorization header found")
-                return None
-
-            token = self.extract_token_from_header(authorization)
+            token = self.get_token_from_request(event)
             if not token:
-                logger.debug("Invalid Authorization header format")
                 return None
 
             user_info = self.validate_jwt_token(token)
@@ -192,5 +288,21 @@ class SupabaseAuth:
             return None
 
 
+def hash_token(token: str) -> bytes:
+    """
+    Hash a JWT token into a compact cache key
+
+    Raw tokens are never stored in caches; a 128-bit BLAKE2b digest is
+    collision-resistant enough to key per-container caches.
+
+    Args:
+        token: The JWT token
+
+    Returns:
+        16-byte digest of the token
+    """
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
 # Global instance
 supabase_auth = SupabaseAuth()
@@ -5,25 +5,32 @@ This package contains decorators, logging utilities, response formatters,
 and security utilities used across the application.
 """
 
+from .cache import TTLCache
 from .decorators import (extract_path_params, lambda_handler, require_auth,
                          validate_json_body)
-from .logging import (log_error, log_lambda_event, log_lambda_response,
-                      setup_logger)
-from .responses import (HTTPStatus, cors_headers, error_response,
+from .events import get_header
+from .logging import (lambda_context_fields, log_error, log_lambda_event,
+                      log_lambda_response, setup_logger)
+from .responses import (HTTPStatus, cors_headers, error_response, json_dumps,
                         not_found_response, success_response,
                         validation_error_response)
 
 __all__ = [
+    # Caching
+    "TTLCache",
     # Decorators
     "lambda_handler",
     "require_auth",
     "validate_json_body",
     "extract_path_params",
+    # Events
+    "get_header",
     # Logging
     "setup_logger",
     "log_lambda_event",
     "log_lambda_response",
     "log_error",
+    "lambda_context_fields",
     # Responses
     "HTTPStatus",
     "success_response",
@@ -31,4 +38,5 @@ __all__ = [
     "validation_error_response",
     "not_found_response",
     "cors_headers",
+    "json_dumps",
 ]
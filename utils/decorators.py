@@ -5,14 +5,17 @@ This module provides decorators that add consistent logging, error handling,
 and response formatting to Lambda functions.
 """
 
-import json
+import logging
 import time
 from functools import wraps
 from typing import Any, Callable, Dict, Optional
 
-from .logging import (log_error, log_lambda_event, log_lambda_response,
-                      setup_logger)
-from .responses import HTTPStatus, error_response
+import orjson
+from pydantic import ValidationError
+
+from .logging import (lambda_context_fields, log_error, log_lambda_event,
+                      log_lambda_response, setup_logger)
+from .responses import HTTPStatus, error_response, validation_error_response
 
 
 def lambda_handler(
@@ -25,7 +28,8 @@ def lambda_handler(
     Decorator for Lambda function handlers that provides:
     - Consistent logging setup
     - Automatic event/response logging
-    - Error handling and response formatting
+    - Error handling and response formatting, including Pydantic validation
+      errors as 400 responses
     - Execution time tracking
 
     Args:
@@ -46,7 +50,8 @@ def lambda_handler(
                 logger_name or func.__module__, structured=structured_logging
             )
 
-            start_time = time.time()
+            # Monotonic clock: immune to wall-clock adjustments mid-request
+            start_ns = time.monotonic_ns()
 
             try:
                 # Log incoming event
@@ -65,21 +70,26 @@ def lambda_handler(
 
                 # Log response
                 if log_response:
-                    execution_time = (time.time() - start_time) * 1000
+                    execution_time = (time.monotonic_ns() - start_ns) / 1_000_000
                     log_lambda_response(logger, response, execution_time)
 
                 return response
 
+            except ValidationError as e:
+                # Model validation failures are client errors, not server errors
+                return validation_error_response(
+                    "Request validation failed", {"validation_errors": e.errors()}
+                )
+
             except Exception as e:
-                execution_time = (time.time() - start_time) * 1000
+                execution_time = (time.monotonic_ns() - start_ns) / 1_000_000
 
                 # Log the error with context
                 log_error(
                     logger,
                     e,
                     {
-                        "function_name": getattr(context, "function_name", "unknown"),
-                        "request_id": getattr(context, "aws_request_id", "unknown"),
+                        **lambda_context_fields(context),
                         "execution_time_ms": execution_time,
                         "event_path": event.get("path") or event.get("rawPath"),
                         "event_method": event.get("httpMethod")
@@ -125,18 +135,17 @@ def require_auth(func: Callable) -> Callable:
 
         if not auth_context or not auth_context.get("username"):
             # Debug: log the event structure to understand what's available
-            from .logging import setup_logger
-
             logger = setup_logger(__name__)
-            logger.info(
-                "Authorization failed - no valid context found",
-                extra={
-                    "request_context_keys": list(request_context.keys()),
-                    "authorizer_keys": list(authorizer_context.keys()),
-                    "auth_context": auth_context,
-                    "event_keys": list(event.keys()),
-                },
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Authorization failed - no valid context found",
+                    extra={
+                        "request_context_keys": list(request_context.keys()),
+                        "authorizer_keys": list(authorizer_context.keys()),
+                        "auth_context": auth_context,
+                        "event_keys": list(event.keys()),
+                    },
+                )
             return error_response("Unauthorized access", HTTPStatus.UNAUTHORIZED)
 
         # Add auth info to event for easy access in handlers
@@ -161,6 +170,9 @@ def validate_json_body(required_fields: Optional[list] = None) -> Callable:
         Decorated function
     """
 
+    # Freeze the field list once at decoration time
+    required = tuple(required_fields or ())
+
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -170,20 +182,16 @@ def validate_json_body(required_fields: Optional[list] = None) -> Callable:
                 if not body_str:
                     body_str = "{}"
 
-                body = json.loads(body_str)
+                body = orjson.loads(body_str)
                 event["json_body"] = body
 
                 # Validate required fields
-                if required_fields:
+                if required:
                     missing_fields = [
-                        field
-                        for field in required_fields
-                        if field not in body or body[field] is None
+                        field for field in required if body.get(field) is None
                     ]
 
                     if missing_fields:
-                        from .responses import validation_error_response
-
                         return validation_error_response(
                             f"Missing required fields: {', '.join(missing_fields)}",
                             {"missing_fields": missing_fields},
@@ -191,9 +199,7 @@ def validate_json_body(required_fields: Optional[list] = None) -> Callable:
 
                 return func(event, context)
 
-            except json.JSONDecodeError as e:
-                from .responses import validation_error_response
-
+            except orjson.JSONDecodeError as e:
                 return validation_error_response(
                     "Invalid JSON in request body", {"json_error": str(e)}
                 )
@@ -221,14 +227,10 @@ def extract_path_params(*param_names: str) -> Callable:
 
             # Check for missing parameters
             missing_params = [
-                param
-                for param in param_names
-                if param not in path_params or not path_params[param]
+                param for param in param_names if not path_params.get(param)
             ]
 
             if missing_params:
-                from .responses import validation_error_response
-
                 return validation_error_response(
                     f"Missing path parameters: {', '.join(missing_params)}",
                     {"missing_parameters": missing_params},
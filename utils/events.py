@@ -0,0 +1,32 @@
+"""
+Helpers for reading API Gateway Lambda events.
+
+REST API (payload v1) events keep header names as sent by the client, while
+HTTP API (payload v2) events lowercase them; these helpers hide the difference.
+"""
+
+from typing import Any, Dict, Optional
+
+
+def get_header(event: Dict[str, Any], name: str) -> Optional[str]:
+    """
+    Get a request header by name, ignoring case.
+
+    The lowercase name is probed directly first, which is all HTTP API events
+    need; only events with mixed-case header names fall back to a scan. The
+    event is never modified.
+
+    Args:
+        event: Lambda event
+        name: Lowercase header name
+
+    Returns:
+        The header value, or None if the header is absent
+    """
+    headers = event.get("headers") or {}
+    value = headers.get(name)
+    if value is None:
+        for key, candidate in headers.items():
+            if key.lower() == name:
+                return candidate
+    return value
@@ -8,9 +8,27 @@ with proper formatting, log levels, and structured logging capabilities.
 import json
 import logging
 import sys
-from datetime import datetime
+import time
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
+import orjson
+
+from .events import get_header
+
+# LogRecord attributes that are not user-supplied extra fields, captured from
+# a blank record so the set always matches the running Python version (e.g.
+# taskName on 3.12+), plus the fields formatters add during formatting
+_RESERVED_ATTRS = frozenset(
+    vars(logging.LogRecord("", logging.NOTSET, "", 0, "", None, None))
+) | {"message", "asctime"}
+
+
+def _utc_timestamp(record: logging.LogRecord) -> str:
+    """Format the record's creation time as an ISO 8601 UTC timestamp."""
+    created = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created))
+    return f"{created}.{int(record.msecs):03d}Z"
+
 
 class StructuredFormatter(logging.Formatter):
     """
@@ -19,7 +37,7 @@ class StructuredFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": _utc_timestamp(record),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -34,40 +52,30 @@ class StructuredFormatter(logging.Formatter):
 
         # Add any extra fields from the log record
         for key, value in record.__dict__.items():
-            if key not in {
-                "name",
-                "msg",
-                "args",
-                "levelname",
-                "levelno",
-                "pathname",
-                "filename",
-                "module",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-                "lineno",
-                "funcName",
-                "created",
-                "msecs",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "processName",
-                "process",
-                "getMessage",
-            }:
+            if key not in _RESERVED_ATTRS:
                 log_entry[key] = value
 
-        return json.dumps(log_entry, default=str)
+        try:
+            return orjson.dumps(
+                log_entry, default=str, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except orjson.JSONEncodeError:
+            # Values orjson rejects outright (e.g. integers beyond 64 bits)
+            return json.dumps(
+                log_entry, default=str, separators=(",", ":"), ensure_ascii=False
+            )
 
 
+@lru_cache(maxsize=64)
 def setup_logger(
     name: str, level: str = "INFO", structured: bool = True
 ) -> logging.Logger:
     """
     Set up a logger with consistent configuration.
 
+    Results are memoized per (name, level, structured), so the per-invocation
+    calls from the handler decorators reduce to a single cache lookup.
+
     Args:
         name: Logger name (typically __name__)
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -84,8 +92,9 @@ def setup_logger(
 
     logger.setLevel(getattr(logging, level.upper()))
 
-    # Create console handler
+    # Create console handler, filtering at the same level as the logger
     handler = logging.StreamHandler(sys.stdout)
+    handler.setLevel(logger.level)
 
     if structured:
         formatter = StructuredFormatter()
@@ -103,6 +112,22 @@ def setup_logger(
     return logger
 
 
+def lambda_context_fields(context: Any) -> Dict[str, str]:
+    """
+    Get the request ID and function name from the Lambda context.
+
+    Args:
+        context: Lambda context
+
+    Returns:
+        Dictionary with request_id and function_name
+    """
+    return {
+        "request_id": getattr(context, "aws_request_id", "unknown"),
+        "function_name": getattr(context, "function_name", "unknown"),
+    }
+
+
 def log_lambda_event(
     logger: logging.Logger, event: Dict[str, Any], context: Any
 ) -> None:
@@ -114,11 +139,14 @@ def log_lambda_event(
         event: Lambda event
         context: Lambda context
     """
+    # Skip building the extra fields when INFO records would be dropped
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     logger.info(
         "Lambda invocation started",
         extra={
-            "request_id": getattr(context, "aws_request_id", "unknown"),
-            "function_name": getattr(context, "function_name", "unknown"),
+            **lambda_context_fields(context),
             "function_version": getattr(context, "function_version", "unknown"),
             "remaining_time_ms": getattr(
                 context, "get_remaining_time_in_millis", lambda: 0
@@ -126,7 +154,7 @@ def log_lambda_event(
             "http_method": event.get("httpMethod")
             or event.get("requestContext", {}).get("http", {}).get("method"),
             "path": event.get("path") or event.get("rawPath"),
-            "user_agent": event.get("headers", {}).get("user-agent"),
+            "user_agent": get_header(event, "user-agent"),
             "source_ip": event.get("requestContext", {})
             .get("http", {})
             .get("sourceIp"),
@@ -147,6 +175,9 @@ def log_lambda_response(
         response: Lambda response
         execution_time_ms: Execution time in milliseconds
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     logger.info(
         "Lambda invocation completed",
         extra={
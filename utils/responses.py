@@ -5,12 +5,13 @@ This module provides consistent response formatting, error handling,
 and JSON serialization across all API endpoints.
 """
 
-import json
-from datetime import datetime
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, Optional, Union
 
+import orjson
+
 
 class HTTPStatus(Enum):
     """HTTP status codes for API responses."""
@@ -25,6 +26,10 @@ class HTTPStatus(Enum):
     INTERNAL_SERVER_ERROR = 500
 
 
+# Integer codes for HTTPStatus members, resolved once; a dict lookup is cheaper
+# than an isinstance check against the Enum on every response
+_STATUS_CODES = {status: status.value for status in HTTPStatus}
+
 # CORS headers for API responses
 cors_headers = {
     "Access-Control-Allow-Origin": "*",
@@ -33,22 +38,40 @@ cors_headers = {
 }
 
 
-class APIJSONEncoder(json.JSONEncoder):
+# Converters for types orjson does not handle natively, keyed by exact type
+_JSON_ENCODERS = {Decimal: float}
+
+
+def _json_default(obj: Any) -> Any:
     """
-    Custom JSON encoder for API responses that handles:
+    Serialize types orjson does not handle natively:
     - Decimal objects (from DynamoDB)
-    - datetime objects
-    - Other common Python types
+    - Pydantic models
+
+    datetime objects are serialized natively by orjson as ISO 8601 strings.
     """
+    encoder = _JSON_ENCODERS.get(type(obj))
+    if encoder is not None:
+        return encoder(obj)
+    model_dump = getattr(obj, "model_dump", None)
+    if model_dump is not None:  # Pydantic models
+        return model_dump()
+    if isinstance(obj, Decimal):  # Decimal subclasses
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps(obj: Any) -> str:
+    """
+    Serialize an object to a JSON string for a Lambda response body.
+
+    Args:
+        obj: Object to serialize
 
-    def default(self, obj: Any) -> Any:
-        if isinstance(obj, Decimal):
-            return float(obj)
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        if hasattr(obj, "model_dump"):  # Pydantic models
-            return obj.model_dump()
-        return super().default(obj)
+    Returns:
+        JSON string
+    """
+    return orjson.dumps(obj, default=_json_default).decode()
 
 
 def create_response(
@@ -62,23 +85,21 @@ def create_response(
 
     Args:
         status_code: HTTP status code
-        body: Response body (will be JSON serialized)
+        body: Response body; strings are used as already-serialized JSON,
+            anything else is JSON serialized
         headers: Additional headers
         cors_enabled: Whether to include CORS headers
 
     Returns:
         Lambda HTTP response dictionary
     """
-    if isinstance(status_code, HTTPStatus):
-        status_code = status_code.value
-
-    response_headers = {}
+    status_code = _STATUS_CODES.get(status_code, status_code)
 
+    # Each response gets its own headers dict, built in a single expression
     if cors_enabled:
-        response_headers.update(cors_headers)
-
-    if headers:
-        response_headers.update(headers)
+        response_headers = {**cors_headers, **headers} if headers else {**cors_headers}
+    else:
+        response_headers = {**headers} if headers else {}
 
     response = {
         "statusCode": status_code,
@@ -86,10 +107,7 @@ def create_response(
     }
 
     if body is not None:
-        if isinstance(body, (dict, list)) or hasattr(body, "model_dump"):
-            response["body"] = json.dumps(body, cls=APIJSONEncoder)
-        else:
-            response["body"] = str(body)
+        response["body"] = body if isinstance(body, str) else json_dumps(body)
 
     return response
 
@@ -110,18 +128,38 @@ def success_response(
     Returns:
         Lambda HTTP response dictionary
     """
-    body = {}
+    # Build the body in one literal per shape instead of mutating an empty dict
+    if data is None:
+        body = {"message": message} if message else {}
+    elif isinstance(data, dict):
+        body = {"message": message, **data} if message else data
+    else:
+        body = {"message": message, "data": data} if message else {"data": data}
 
-    if message:
-        body["message"] = message
+    return create_response(status_code, body)
 
-    if data is not None:
-        if isinstance(data, dict):
-            body.update(data)
-        else:
-            body["data"] = data
 
-    return create_response(status_code, body)
+@lru_cache(maxsize=128)
+def _error_body(message: str, error_code: Optional[str] = None) -> str:
+    """
+    Serialize an error body without details.
+
+    Such bodies depend only on the message and error code, so the JSON for
+    fixed-message errors is built once and reused.
+
+    Args:
+        message: Error message
+        error_code: Application-specific error code
+
+    Returns:
+        JSON string
+    """
+    body = {"error": message}
+
+    if error_code:
+        body["error_code"] = error_code
+
+    return json_dumps(body)
 
 
 def error_response(
@@ -142,13 +180,13 @@ def error_response(
     Returns:
         Lambda HTTP response dictionary
     """
-    body = {"error": message}
+    if not details:
+        return create_response(status_code, _error_body(message, error_code))
 
     if error_code:
-        body["error_code"] = error_code
-
-    if details:
-        body["details"] = details
+        body = {"error": message, "error_code": error_code, "details": details}
+    else:
+        body = {"error": message, "details": details}
 
     return create_response(status_code, body)
 
@@ -188,12 +226,18 @@ def not_found_response(
         Lambda HTTP response dictionary
     """
     if identifier:
-        message = f"{resource} '{identifier}' not found"
-    else:
-        message = f"{resource} not found"
+        # Messages naming an identifier are unique per request; serialize
+        # them directly so they don't evict the cached canned error bodies
+        return create_response(
+            HTTPStatus.NOT_FOUND,
+            {
+                "error": f"{resource} '{identifier}' not found",
+                "error_code": "RESOURCE_NOT_FOUND",
+            },
+        )
 
     return error_response(
-        message=message,
+        message=f"{resource} not found",
         status_code=HTTPStatus.NOT_FOUND,
         error_code="RESOURCE_NOT_FOUND",
     )